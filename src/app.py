@@ -1,40 +1,204 @@
-import mysql.connector
-from db import get_db_connection, test_connection
-from generate_data import generate_users, drop_users_table
-from dotenv import load_dotenv
-from db_test import test_mysql_connection
-
-def main():
-    load_dotenv()
-
-    test_connection()
-    
-    # Establish database connection
-    connection = get_db_connection()
-    
+import time
+
+# Taken before any other project import so `bench` can report startup cost
+_START_TIME = time.perf_counter()
+
+import argparse
+import sys
+
+from db import get_db_connection
+
+# Modules that must only be loaded by the subcommands that need them
+LAZY_MODULES = ("faker", "mysql.connector")
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got {value}")
+    return number
+
+
+def check_lazy_imports():
+    """
+    Import app, db, generate_data and user_repository in a fresh interpreter.
+    Returns the import time and the heavy modules that were loaded eagerly.
+    """
+    import json
+    import os
+    import subprocess
+
+    script = (
+        "import json, sys, time\n"
+        "sys.path.insert(0, sys.argv[1])\n"
+        "start = time.perf_counter()\n"
+        "import app, db, generate_data, user_repository\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'import_time': elapsed,\n"
+        "                  'loaded': [m for m in sys.argv[2:] if m in sys.modules]}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, os.path.dirname(os.path.abspath(__file__)), *LAZY_MODULES],
+        capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout)
+    return report["import_time"], report["loaded"]
+
+
+def seed(connection, args):
+    # Faker and the generator module are only loaded for this subcommand
+    from generate_data import generate_users
+
+    generate_users(connection, args.count, args.batch_size)
+
+
+def drop_table(connection, args):
+    from generate_data import drop_users_table
+
+    drop_users_table(connection)
+
+
+def list_users(connection, args):
+    """
+    Print one page of users using LIMIT/OFFSET pagination.
+    """
+    cursor = connection.cursor(dictionary=True)
     try:
-        # Generate and insert 1 million users
-        generate_users(connection, 1000000)
+        cursor.execute(
+            "SELECT id, username, email FROM users ORDER BY id ASC LIMIT %s OFFSET %s",
+            (args.limit, args.offset)
+        )
+        for user in cursor.fetchall():
+            print(f"{user['id']}: {user['username']} ({user['email']})")
     finally:
-        # Close the database connection
-        connection.close()
+        cursor.close()
+
+
+def export_users(connection, args):
+    """
+    Stream the users table to CSV using keyset pagination (WHERE id > last_id),
+    so every batch is an index range scan instead of a growing OFFSET.
+    """
+    import csv
+
+    output = None
+    cursor = None
+    exported = 0
+    try:
+        output = open(args.output, "w", newline="") if args.output else sys.stdout
+        cursor = connection.cursor(dictionary=True)
+        writer = None
+
+        last_id = 0
+        while True:
+            cursor.execute(
+                "SELECT * FROM users WHERE id > %s ORDER BY id ASC LIMIT %s",
+                (last_id, args.batch_size)
+            )
+            rows = cursor.fetchall()
+            if writer is None:
+                # Header comes from the first batch, even when it is empty
+                columns = [column[0] for column in cursor.description]
+                writer = csv.DictWriter(output, fieldnames=columns)
+                writer.writeheader()
+            if not rows:
+                break
+            writer.writerows(rows)
+            last_id = rows[-1]["id"]
+            exported += len(rows)
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    print(f"Exported {exported} users", file=sys.stderr)
+
+
+def bench(connection, args):
+    """
+    Report driver load + connect time and time-to-first-query for this process,
+    then check that the project modules import without faker/mysql.connector.
+    """
+    cursor = connection.cursor()
+    try:
+        query_start = time.perf_counter()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        query_time = time.perf_counter() - query_start
+    finally:
+        cursor.close()
+
+    first_query = time.perf_counter() - _START_TIME
+
+    print(f"Driver load + connect time: {args.connect_time * 1000:.2f}ms")
+    print(f"First query: {query_time * 1000:.2f}ms")
+    print(f"Time to first query: {first_query * 1000:.2f}ms")
+
+    # Runs after the timings above so the child interpreter is not counted
+    import_time, loaded = check_lazy_imports()
+    print(f"Import time (app, db, generate_data, user_repository): {import_time * 1000:.2f}ms")
+    if loaded:
+        print(f"Error: imported eagerly: {', '.join(loaded)}")
+        return 1
 
-def drop_table():
-    load_dotenv()
 
-    test_connection()
-    
-    # Establish database connection
+def build_parser():
+    parser = argparse.ArgumentParser(description="Manage the users test table")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser("seed", help="Generate and insert fake users")
+    seed_parser.add_argument("--count", type=positive_int, default=1000000)
+    seed_parser.add_argument("--batch-size", type=positive_int, default=200)
+    seed_parser.set_defaults(handler=seed)
+
+    drop_parser = subparsers.add_parser("drop", help="Drop the users table")
+    drop_parser.set_defaults(handler=drop_table)
+
+    list_parser = subparsers.add_parser("list", help="Print a page of users")
+    list_parser.add_argument("--limit", type=positive_int, default=100)
+    list_parser.add_argument("--offset", type=non_negative_int, default=0)
+    list_parser.set_defaults(handler=list_users)
+
+    export_parser = subparsers.add_parser("export", help="Export users as CSV")
+    export_parser.add_argument("--output", help="File to write (defaults to stdout)")
+    export_parser.add_argument("--batch-size", type=positive_int, default=10000)
+    export_parser.set_defaults(handler=export_users)
+
+    bench_parser = subparsers.add_parser("bench", help="Measure import time and time-to-first-query")
+    bench_parser.set_defaults(handler=bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # One connection for the whole command; get_db_connection() already
+    # checks is_connected(), so no separate test connection is opened.
+    # The first call also imports the driver and reads the config.
+    connect_start = time.perf_counter()
     connection = get_db_connection()
-    
+    args.connect_time = time.perf_counter() - connect_start
+
+    if connection is None:
+        return 1
+
     try:
-        # Generate and insert 1 million users
-        drop_users_table(connection)
+        status = args.handler(connection, args)
     finally:
         # Close the database connection
         connection.close()
 
+    return status or 0
+
 
 if __name__ == "__main__":
-    # drop_table()
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -1,22 +1,38 @@
-import mysql.connector
-from mysql.connector import Error
-from dotenv import load_dotenv
 import os
+from functools import lru_cache
 
-load_dotenv('.env')
+
+@lru_cache(maxsize=None)
+def get_db_config():
+    """
+    Read the database settings from the environment (and .env) once.
+    Returns a dict of keyword arguments for mysql.connector.connect().
+    """
+    # Imported here so that importing this module stays cheap
+    from dotenv import find_dotenv, load_dotenv
+
+    # Prefer .env in the current working directory, otherwise search
+    # upwards from this file so the repo-root .env is found from anywhere
+    if os.path.exists('.env'):
+        load_dotenv('.env')
+    else:
+        load_dotenv(find_dotenv())
+
+    return {
+        "host": os.getenv('DB_HOST'),
+        "database": os.getenv('DB_NAME'),
+        "user": os.getenv('DB_USER'),
+        "password": os.getenv('DB_PASSWORD'),
+        "port": int(os.getenv('DB_PORT', '3306')),  # Added port with default
+    }
 
 def get_db_connection():
-    # Load environment variables from .env file
-    load_dotenv()
+    # The driver is only loaded once a connection is actually needed
+    import mysql.connector
+    from mysql.connector import Error
 
     try:
-        connection = mysql.connector.connect(
-            host=os.getenv('DB_HOST'),
-            database=os.getenv('DB_NAME'),
-            user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASSWORD'),
-            port=int(os.getenv('DB_PORT', '3306'))  # Added port with default
-        )
+        connection = mysql.connector.connect(**get_db_config())
         if connection.is_connected():
             return connection
     except Error as e:
@@ -29,6 +45,8 @@ def test_connection():
     Test the database connection by connecting and executing a simple query.
     Returns True if successful, False otherwise.
     """
+    from mysql.connector import Error
+
     connection = None
     try:
         # Get connection
@@ -1,13 +1,24 @@
-import mysql.connector
-from faker import Faker
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 import random
-import string
+from typing import TYPE_CHECKING
 
-fake = Faker()
+if TYPE_CHECKING:
+    import mysql.connector
 
-def drop_users_table(db_connection: mysql.connector.CMySQLConnection):
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Build the shared Faker instance on first use.
+    Constructing Faker loads all of its providers, so only seeding pays for it.
+    """
+    from faker import Faker
+
+    return Faker()
+
+def drop_users_table(db_connection: "mysql.connector.CMySQLConnection"):
     """
     Drop the users table.
     
@@ -29,7 +40,7 @@ def drop_users_table(db_connection: mysql.connector.CMySQLConnection):
         cursor.close()
 
 
-def ensure_users_table_exists(db_connection: mysql.connector.CMySQLConnection):
+def ensure_users_table_exists(db_connection: "mysql.connector.CMySQLConnection"):
     """
     Check if the users table exists, and create it if it doesn't.
     
@@ -71,7 +82,7 @@ def ensure_users_table_exists(db_connection: mysql.connector.CMySQLConnection):
     finally:
         cursor.close()
 
-def generate_users(db_connection: mysql.connector.CMySQLConnection, num_users, batch_size=200):
+def generate_users(db_connection: "mysql.connector.CMySQLConnection", num_users, batch_size=200):
     """
     Generate fake users with batched inserts to improve performance.
     
@@ -81,6 +92,10 @@ def generate_users(db_connection: mysql.connector.CMySQLConnection, num_users, b
         batch_size: Number of users to insert in each batch
     """
 
+    import mysql.connector
+
+    fake = get_faker()
+
     # First ensure the table exists
     ensure_users_table_exists(db_connection)
     
@@ -189,18 +204,10 @@ def generate_users(db_connection: mysql.connector.CMySQLConnection, num_users, b
 # Example usage
 if __name__ == "__main__":
     # This is just an example - replace with your actual connection
-    from dotenv import load_dotenv
-    import os
-    
-    load_dotenv()
+    import mysql.connector
+    from db import get_db_config
     
-    db_connection = mysql.connector.connect(
-        host=os.getenv('DB_HOST'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME'),
-        port=int(os.getenv('DB_PORT', '3306'))
-    )
+    db_connection = mysql.connector.connect(**get_db_config())
     
     # Generate 1000 users with batch size of 100
     generate_users(db_connection, 1000, 100)
@@ -0,0 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from app import check_lazy_imports
+
+
+def test_imports_do_not_load_faker_or_driver():
+    _, loaded = check_lazy_imports()
+
+    assert loaded == []